@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from .enums import PayloadKind
-from .payload import EMPTY_PAYLOAD
+from .payload import EMPTY_PAYLOAD, NonEmptyPayload
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -75,7 +75,7 @@ def parse_received_payload(json: Json, /) -> Payload:
         return EMPTY_PAYLOAD
 
     else:
-        kind = PayloadKind(json["kind"])
+        kind = NonEmptyPayload.codecs["kind"].decode(json["kind"])
         cls = payload_kind_to_cls(kind)
         return cls(json)
 
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
-from json import JSONDecodeError
+from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from aiohttp import WSMsgType
+from orjson import JSONDecodeError, loads
 
 from ..bases import StrIdentifiable
 from ..codecs import DatetimeCodec, EnumCodec, PrimitiveCodec, SerialisableCodec
-from ..utils import encode_datetime, protocol_error
+from ..utils import protocol_error, validate
 from .Payloads import parse_received_payload
 from .subprotocol import CustomWSCloseCode, CustomWSMessageType, WSEventStatus
 
 if TYPE_CHECKING:
-    from datetime import datetime
     from typing import Self
 
     from aiohttp import WSMessage
@@ -34,9 +34,15 @@ class CustomWSMessage(StrIdentifiable):
 
     def with_sent_at(self, sent_at: datetime, /) -> Self:
         cls = type(self)
-        json = self.json()
-        json["sent_at"] = encode_datetime(sent_at)
-        return cls(json)
+
+        # Copy the decoded fields across instead of round-tripping the message through JSON
+        # This avoids re-parsing the timestamp and payload that we already hold
+        message = cls.__new__(cls)
+        for key in cls.codecs:
+            setattr(message, key, getattr(self, key))
+
+        message.sent_at = validate(sent_at, datetime)
+        return message
 
 
 class WSEvent(CustomWSMessage):
@@ -85,36 +91,62 @@ class WSAck(CustomWSMessage):
         return cls(json)
 
 
-_MAPPING = {
+_MAPPING: dict[CustomWSMessageType, type[CustomWSMessage]] = {
     CustomWSMessageType.Event: WSEvent,
     CustomWSMessageType.Ack: WSAck,
 }
 
 
+# aiohttp always reports frame types as WSMsgType members, so they can be compared by identity
+_TEXT = WSMsgType.TEXT
+
+# A JSON object may only be preceded by insignificant whitespace
+_OBJECT_PREFIXES = frozenset("{ \t\n\r")
+
+
+_ERROR_MAP: dict[type[Exception], CustomWSCloseCode] = {
+    JSONDecodeError: CustomWSCloseCode.InvalidJSON,
+    KeyError: CustomWSCloseCode.MissingField,
+    TypeError: CustomWSCloseCode.InvalidType,
+    ValueError: CustomWSCloseCode.InvalidValue,
+}
+
+
 def make_id() -> str:
     return str(uuid4())
 
 
 def parse_received_message(message: WSMessage, /) -> CustomWSMessage:
-    if message.type != WSMsgType.TEXT:
+    if message.type is not _TEXT:
         protocol_error(CustomWSCloseCode.InvalidFrameType)
 
+    data = message.data
+
+    # Anything that can't be a JSON object is rejected without running the parser
+    if data[:1] not in _OBJECT_PREFIXES:
+        protocol_error(CustomWSCloseCode.InvalidJSON)
+
     try:
-        json = message.json()
+        json = loads(data)
+
+        # WSException isn't registered in the error map, so this propagates unchanged
+        if type(json) is not dict:
+            protocol_error(CustomWSCloseCode.InvalidJSON)
 
         if json["sent_at"] is None:
             raise TypeError("'sent_at' field required.")
 
-        type_ = CustomWSMessageType(json["type"])
+        type_ = CustomWSMessage.codecs["type"].decode(json["type"])
         cls = _MAPPING[type_]
 
         return cls(json)
 
-    except JSONDecodeError:
-        protocol_error(CustomWSCloseCode.InvalidJSON)
-    except KeyError:
-        protocol_error(CustomWSCloseCode.MissingField)
-    except TypeError:
-        protocol_error(CustomWSCloseCode.InvalidType)
-    except ValueError:
-        protocol_error(CustomWSCloseCode.InvalidValue)
+    except Exception as error:
+        # The most specific registered base class of the error decides the close code
+        for error_cls in type(error).__mro__:
+            code = _ERROR_MAP.get(error_cls)
+
+            if code is not None:
+                protocol_error(code)
+
+        raise
@@ -8,6 +8,7 @@ from asyncio import (
     gather,
     sleep,
 )
+from collections import deque
 from logging import DEBUG, ERROR
 from typing import TYPE_CHECKING, Protocol
 
@@ -90,7 +91,7 @@ class WSProxy:
         self.__ratelimited = ratelimited
         self.__limit = limit
         self.__interval = interval
-        self.__hits: list[float] = []
+        self.__hits: deque[float] = deque(maxlen=limit)
 
         self.__sent_unacked: dict[str, TN] = dict()
         self.__received_unacked: set[str] = set()
@@ -246,22 +247,30 @@ class WSProxy:
         await self.close(code=code)
 
     async def __reader__(self) -> None:
+        # None of these change once the proxy has started, so bind them to locals up front
+        ratelimited = self.__ratelimited
+        hits, limit, interval = self.__hits, self.__limit, self.__interval
+        put = self.__queue.put
+        receive_event = self.__receive_event__
+        receive_ack = self.__receive_ack__
 
         async for message in self.__response:
 
-            if self.__ratelimited:
-                check_ratelimit(self.__hits, limit=self.__limit, interval=self.__interval)
+            if ratelimited:
+                check_ratelimit(hits, limit=limit, interval=interval)
 
             custom_message = parse_received_message(message)
 
-            if isinstance(custom_message, WSEvent):
-                result = self.__receive_event__(custom_message)
+            message_cls = type(custom_message)
+
+            if message_cls is WSEvent:
+                result = receive_event(custom_message)
 
                 if result:
-                    await self.__queue.put(custom_message)
+                    await put(custom_message)
 
-            elif isinstance(custom_message, WSAck):
-                self.__receive_ack__(custom_message)
+            elif message_cls is WSAck:
+                receive_ack(custom_message)
 
             # The parser should never allow this to be reached
             else:
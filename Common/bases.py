@@ -60,8 +60,22 @@ class SerialisableMeta(type):
         else:
             extra_slots = tuple(extra_slots)
 
+        # Gather the slots that the base classes already provide
+        # Redeclaring them would give each instance an extra slot that shadows the inherited one
+        inherited_slots = set()
+        for base in bases:
+            for klass in base.__mro__:
+                base_slots = vars(klass).get("__slots__", ())
+                if isinstance(base_slots, str):
+                    base_slots = (base_slots,)
+                inherited_slots.update(base_slots)
+
         # De-duplicate the slots (and maintain order)
-        all_slots = tuple(dict.fromkeys(current_slots + extra_slots))
+        all_slots = tuple(
+            slot
+            for slot in dict.fromkeys(current_slots + extra_slots)
+            if slot not in inherited_slots
+        )
         namespace["__slots__"] = all_slots
 
         return super().__new__(cls, name, bases, namespace, **kwargs)
@@ -76,7 +90,9 @@ class Serialisable(metaclass=SerialisableMeta):
         if cls is Serialisable:
             raise RuntimeError(f"{cls.__name__} must not be directly instantiated.")
 
-        validate(json, dict)
+        # Parsed JSON objects are always exact dicts, so only fall back to validate() otherwise
+        if type(json) is not dict:
+            validate(json, dict)
 
         for key, codec in cls.codecs.items():
             setattr(self, key, codec.decode(json[key]))
@@ -40,25 +40,35 @@ class Codec(ABC):
 class EnumCodec(Codec):
     def __init__(self, cls: type[Enum], /):
         self.cls = cls
+        # A plain dict lookup bypasses the Python-level EnumType.__call__ machinery
+        self.value_to_member = {member.value: member for member in cls}
 
     def encode(self, value, /):
         validate(value, self.cls)
         return value.value
 
     def decode(self, value, /):
-        obj = self.cls(value)
-        return obj
+        try:
+            return self.value_to_member[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} is not a valid {self.cls.__qualname__}") from None
 
 
 class PrimitiveCodec(Codec):
     def __init__(self, *types: type[Primitive], optional: bool = False):
         self.types = types
         self.optional = optional
+        # Values of exactly one of these types skip validate(); subclasses still go through it
+        self.exact_types = frozenset(types + (type(None),) if optional else types)
 
     def encode(self, value, /):
+        if type(value) in self.exact_types:
+            return value
         return validate(value, *self.types, optional=self.optional)
 
     def decode(self, value, /):
+        if type(value) in self.exact_types:
+            return value
         return validate(value, *self.types, optional=self.optional)
 
 
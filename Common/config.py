@@ -1,9 +1,18 @@
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, fields, is_dataclass
+from functools import cache
+from hashlib import blake2b
+from logging import WARNING
+from os import getpid, replace
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, dump
+from pickle import load as load_pickle
+from struct import Struct
 from tomllib import load
+from types import UnionType
+from typing import Any, Union, get_args, get_origin
 
-from dacite import from_dict
-
-from .utils import root_dir
+from .utils import log, root_dir, validate
 
 __all__ = (
     "HandshakePolicyConfig",
@@ -14,16 +23,16 @@ __all__ = (
     "ServerConfig",
     "AutopilotConfig",
     "GlobalConfig",
-    "config",
+    "get_config",
 )
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class HandshakePolicyConfig:
     ack_timeout: float
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class PostgresConfig:
     host: str
     port: int
@@ -34,7 +43,7 @@ class PostgresConfig:
     max_connection_pool_size: int
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class HTTPConfig:
     max_retries: int
     max_sleep_time: float
@@ -46,7 +55,7 @@ class HTTPConfig:
     backoff_cap: float
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class APIConfig:
     host: str
     port: int
@@ -56,12 +65,12 @@ class APIConfig:
     http: HTTPConfig
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class ClientConfig:
     api: APIConfig
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class ServerConfig:
     host: str
     port: int
@@ -80,21 +89,134 @@ class ServerConfig:
     handshake_policy: HandshakePolicyConfig
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class AutopilotConfig:
     api: APIConfig
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class GlobalConfig:
     client: ClientConfig
     server: ServerConfig
     autopilot: AutopilotConfig
 
 
-config_file_path = root_dir() / "config.toml"
+@cache
+def _compile_builder(cls: type, /) -> Callable[[dict[str, Any]], Any]:
+    # Generate a constructor specialised to the exact fields of the config schema
+    # For example: def _build_HTTPConfig(d): return _cls(max_retries=validate(d[...], _t0_0), ...)
+    # Builders and types are bound to placeholder names rather than their own __name__
+    namespace = {"validate": validate, "_cls": cls}
+    arguments = []
+
+    for i, field in enumerate(fields(cls)):
+        value = f"d[{field.name!r}]"
+        placeholder = f"_t{i}"
+
+        if is_dataclass(field.type):
+            namespace[placeholder] = _compile_builder(field.type)
+            arguments.append(f"{field.name}={placeholder}({value})")
+            continue
+
+        # Unions such as str | None are checked against each of their members
+        if get_origin(field.type) in (Union, UnionType):
+            types = get_args(field.type)
+        else:
+            types = (field.type,)
+
+        # validate() needs plain classes, so reject anything else when compiling
+        if not all(isinstance(t, type) and not get_args(t) for t in types):
+            raise TypeError(
+                f"Unsupported annotation for {cls.__name__}.{field.name}: {field.type!r}"
+            )
+
+        placeholders = [f"{placeholder}_{j}" for j in range(len(types))]
+        namespace.update(zip(placeholders, types))
+        arguments.append(f"{field.name}=validate({value}, {', '.join(placeholders)})")
+
+    name = f"_build_{cls.__name__}"
+    source = f"def {name}(d):\n    return _cls({', '.join(arguments)})\n"
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+
+    return namespace[name]
+
+
+def _schema_fields(cls: type, /) -> tuple:
+    # Slotted dataclasses unpickle their state positionally, so field order matters too
+    return tuple(
+        (
+            field.name,
+            _schema_fields(field.type) if is_dataclass(field.type) else repr(field.type),
+        )
+        for field in fields(cls)
+    )
+
+
+# A cache pickled under a different schema would unpickle into the wrong fields
+_SCHEMA_FINGERPRINT = blake2b(
+    repr(_schema_fields(GlobalConfig)).encode(), digest_size=8
+).digest()
+
+# The cache file starts with the (mtime_ns, size) of the config.toml it was built from
+# This is followed by the fingerprint of the schema that it was built with
+_CACHE_HEADER = Struct("=qq8s")
+
+
+def _read_cached_config(cache_path: Path, key: bytes, /) -> GlobalConfig | None:
+    try:
+        with cache_path.open("rb") as cache_file:
+            if cache_file.read(_CACHE_HEADER.size) != key:
+                return None
+
+            cached = load_pickle(cache_file)
+
+    # Missing, truncated or otherwise unreadable caches are rebuilt from scratch
+    except Exception:
+        return None
+
+    return cached if isinstance(cached, GlobalConfig) else None
+
+
+def _write_cached_config(cache_path: Path, key: bytes, config: GlobalConfig, /) -> None:
+    temp_path = cache_path.with_name(f"{cache_path.name}.{getpid()}")
+
+    try:
+        with temp_path.open("wb") as temp_file:
+            temp_file.write(key)
+            dump(config, temp_file, protocol=HIGHEST_PROTOCOL)
+
+        # Swap the file in atomically so that concurrent readers never see a partial write
+        replace(temp_path, cache_path)
+
+    except OSError as error:
+        temp_path.unlink(missing_ok=True)
+        log(f"Failed to write config cache - {type(error).__name__}.", WARNING)
+
+
+@cache
+def get_config() -> GlobalConfig:
+    config_file_path = root_dir() / "config.toml"
+    cache_file_path = root_dir() / "config.toml.cache"
+
+    stat = config_file_path.stat()
+    key = _CACHE_HEADER.pack(stat.st_mtime_ns, stat.st_size, _SCHEMA_FINGERPRINT)
+
+    cached = _read_cached_config(cache_file_path, key)
+    if cached is not None:
+        return cached
+
+    with config_file_path.open("rb") as config_file:
+        config_data = load(config_file)
+
+    config = _compile_builder(GlobalConfig)(config_data)
+    _write_cached_config(cache_file_path, key, config)
+
+    return config
+
 
-with config_file_path.open("rb") as config_file:
-    config_data = load(config_file)
+def __getattr__(name: str) -> GlobalConfig:
+    # Defer reading config.toml until the config is first accessed
+    if name == "config":
+        return get_config()
 
-config: GlobalConfig = from_dict(GlobalConfig, config_data)  # noqa
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
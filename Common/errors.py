@@ -28,6 +28,8 @@ __all__ = (
 
 
 class ResourceConflict(Exception):
+    __slots__ = ("session", "resource_id")
+
     def __init__(self, session: Session, resource_id: int, /, *args: Any):
         super().__init__(*args)
         self.session = session  # The *requesting* session
@@ -35,6 +37,8 @@ class ResourceConflict(Exception):
 
 
 class ResourceLocked(ResourceConflict):
+    __slots__ = ()
+
     def __init__(self, session: Session, resource_id: int, /):
         super().__init__(
             session, resource_id, "Requested resource is already locked by another session."
@@ -42,6 +46,8 @@ class ResourceLocked(ResourceConflict):
 
 
 class SessionBound(ResourceConflict):
+    __slots__ = ()
+
     def __init__(self, session: Session, resource_id: int, /):
         super().__init__(
             session, resource_id, "Requesting session is already bound to a resource."
@@ -49,6 +55,8 @@ class SessionBound(ResourceConflict):
 
 
 class ResourceNotOwned(ResourceConflict):
+    __slots__ = ()
+
     def __init__(self, session: Session, resource_id: int, /):
         super().__init__(
             session, resource_id, "Requesting session is not bound to the requested resource."
@@ -56,10 +64,12 @@ class ResourceNotOwned(ResourceConflict):
 
 
 class NetworkException(Exception):
-    pass
+    __slots__ = ()
 
 
 class RatelimitException(NetworkException):
+    __slots__ = ("hits", "limit", "interval")
+
     def __init__(
         self,
         hits: list[float],
@@ -75,6 +85,8 @@ class RatelimitException(NetworkException):
 
 
 class HTTPException(NetworkException):
+    __slots__ = ("headers", "status", "reason", "json")
+
     def __init__(
         self,
         headers: Json,
@@ -90,6 +102,8 @@ class HTTPException(NetworkException):
 
 
 class WSException(NetworkException):
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: CloseCode,
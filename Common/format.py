@@ -1,11 +1,24 @@
-__all__ = ("LOGGING_FORMAT", "FILE_DATE_FORMAT", "ENCODE_DATETIME_FORMAT", "format_http")
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+__all__ = ("LOGGING_FORMAT", "format_file_date", "format_http")
 
 
 LOGGING_FORMAT = "[PID: %(process)06d] %(asctime)s - %(levelname)-8s - %(message)s"
-FILE_DATE_FORMAT = "%Y-%m-%d_%H-%M-%S"
-ENCODE_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
 
 
+# Status/reason pairs come from a small set, so repeated errors reuse the same string
+@lru_cache(maxsize=512)
 def format_http(status: int, reason: str | None, /) -> str:
     f_reason = f" {reason}" if reason is not None else ""
     return f"{status}{f_reason}"
+
+
+# Equivalent to t.strftime("%Y-%m-%d_%H-%M-%S") without the format string walk
+def format_file_date(t: datetime, /) -> str:
+    return f"{t.year:04d}-{t.month:02d}-{t.day:02d}_{t.hour:02d}-{t.minute:02d}-{t.second:02d}"
@@ -31,6 +31,9 @@ class Token(StrIdentifiable):
     killed_at: datetime | None
     session: Session
 
+    # The server indexes tokens by key through weak references
+    __slots__ = ("__weakref__",)
+
     @property
     def killed(self) -> bool:
         return self.killed_at is not None
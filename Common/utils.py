@@ -4,6 +4,7 @@ from asyncio import get_running_loop
 from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from functools import partial
+from importlib import import_module
 from logging import (
     DEBUG,
     INFO,
@@ -13,22 +14,26 @@ from logging import (
     getLogger,
 )
 from logging.handlers import QueueHandler, QueueListener
-from multiprocessing import Queue
+from multiprocessing import SimpleQueue, get_context
 from os import cpu_count, makedirs
 from pathlib import Path
+from queue import SimpleQueue as LocalSimpleQueue
 from signal import SIGINT, SIGTERM, signal
-from time import time
+from sys import platform
+from time import strftime, time
 from typing import TYPE_CHECKING
 
-from bcrypt import checkpw, gensalt, hashpw
+from orjson import loads
 
 from .errors import RatelimitException, WSException
-from .format import ENCODE_DATETIME_FORMAT, FILE_DATE_FORMAT, LOGGING_FORMAT
+from .format import LOGGING_FORMAT, format_file_date
 
 if TYPE_CHECKING:
     from asyncio import AbstractEventLoop, Future
+    from collections import deque
     from collections.abc import Callable
-    from typing import Any, ParamSpec, Self, TypeVar
+    from logging import LogRecord
+    from typing import Any, ClassVar, ParamSpec, Self, TypeVar
 
     from aiohttp import ClientResponse, WSCloseCode
     from aiohttp.web import Request
@@ -48,6 +53,8 @@ __all__ = (
     "validate",
     "check_password",
     "encrypt_password",
+    "check_password_async",
+    "encrypt_password_async",
     "check_ratelimit",
     "make_future",
     "to_json",
@@ -70,18 +77,25 @@ def root_dir() -> Path:
 
 
 def now() -> datetime:
-    return datetime.now().astimezone(timezone.utc)
+    return datetime.now(timezone.utc)
 
 
 def decode_datetime(t: str, /) -> datetime:
-    return datetime.strptime(t, ENCODE_DATETIME_FORMAT)
+    decoded = datetime.fromisoformat(t)
+
+    if decoded.tzinfo is None:
+        raise ValueError("Datetime must be timezone-aware.")
+    else:
+        return decoded
 
 
 def encode_datetime(t: datetime, /) -> str:
     if t.tzinfo is None:
         raise ValueError("Datetime must be timezone-aware.")
-    else:
-        return t.strftime(ENCODE_DATETIME_FORMAT)
+
+    # isoformat() writes the offset as +HH:MM, but the API specifies the +HHMM form of %z
+    encoded = t.isoformat(timespec="microseconds")
+    return encoded[:26] + encoded[26:].replace(":", "")
 
 
 def validate(obj: T, *types: type, optional: bool = False) -> T:
@@ -95,22 +109,47 @@ def validate(obj: T, *types: type, optional: bool = False) -> T:
     raise TypeError(f"Expected {expected}; got {type(obj).__name__}")
 
 
-def check_password(password: str, hashed_password: str, /) -> bool:
-    return checkpw(password.encode(), hashed_password.encode())
+def _to_bytes(value: bytes | str, /) -> bytes:
+    return value if isinstance(value, bytes) else value.encode()
+
+
+# bcrypt is imported on first use so that processes which never hash passwords skip it
+# Pools that do hash passwords preload it, so that their forked workers inherit it
+def check_password(password: bytes | str, hashed_password: bytes | str, /) -> bool:
+    from bcrypt import checkpw
+
+    return checkpw(_to_bytes(password), _to_bytes(hashed_password))
+
+
+def encrypt_password(password: bytes | str, /) -> str:
+    from bcrypt import gensalt, hashpw
+
+    return hashpw(_to_bytes(password), gensalt()).decode()
 
 
-def encrypt_password(password: str, /) -> str:
-    return hashpw(password.encode(), gensalt()).decode()
+async def check_password_async(
+    password: bytes | str, hashed_password: bytes | str, /, *, pool: CustomProcessPoolExecutor
+) -> bool:
+    return await pool.submit_async(check_password, password, hashed_password)
 
 
-def check_ratelimit(hits: list[float], /, *, limit: int, interval: float) -> None:
+async def encrypt_password_async(
+    password: bytes | str, /, *, pool: CustomProcessPoolExecutor
+) -> str:
+    # The salt is generated in the worker process alongside the hash
+    return await pool.submit_async(encrypt_password, password)
+
+
+def check_ratelimit(hits: deque[float], /, *, limit: int, interval: float) -> None:
     t = time()
     cutoff = t - interval
 
-    hits[:] = [hit for hit in hits if hit > cutoff]
+    # Hits are appended in chronological order, so expired hits are always at the front
+    while hits and hits[0] <= cutoff:
+        hits.popleft()
 
     if len(hits) >= limit:
-        raise RatelimitException(hits, limit=limit, interval=interval)
+        raise RatelimitException(list(hits), limit=limit, interval=interval)
 
     hits.append(t)
 
@@ -124,7 +163,7 @@ def make_future(loop: AbstractEventLoop | None = None, /) -> Future:
 
 async def to_json(r: Request | ClientResponse, /, *, strict: bool = False) -> Json:
     try:
-        data = await r.json()
+        data = await r.json(loads=loads)
         if not isinstance(data, dict):
             raise ValueError(f"Expected dict, got {type(data).__name__}.")
         return data
@@ -139,52 +178,125 @@ def protocol_error(code: CloseCode, /) -> None:
     raise WSException(code=code)
 
 
-def _setup_handler(level: int, queue: Queue, /) -> None:
-    root = getLogger()
-    root.setLevel(level)
-    root.handlers.clear()
-    root.addHandler(QueueHandler(queue))
+# SimpleQueue has no feeder thread, but it only exposes a blocking put() and get()
+# Its put() writes to the pipe under a lock shared by every process, so it can stall the caller
+# Only child processes log through it; the parent process uses an in-memory queue instead
+class _QueueHandler(QueueHandler):
+    def enqueue(self, record: LogRecord) -> None:
+        self.queue.put(record)
+
+
+class _QueueListener(QueueListener):
+    def dequeue(self, block: bool) -> LogRecord:
+        return self.queue.get()
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+# The root logger is a singleton, so it is safe to look it up once
+_logger = getLogger()
+
+
+def _setup_handler(level: int, queue: SimpleQueue | LocalSimpleQueue, /) -> None:
+    _logger.setLevel(level)
+    _logger.handlers.clear()
+    _logger.addHandler(_QueueHandler(queue))
+
+
+class _LoggingFormatter(Formatter):
+    def __init__(self, fmt: str, /):
+        # The format string is a trusted constant, so skip validating it
+        super().__init__(fmt, validate=False)
+        self.__last_second: int | None = None
+        self.__last_asctime: str = ""
+
+    def formatTime(self, record: LogRecord, datefmt: str | None = None) -> str:
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+
+        # Only re-run strftime when a record lands in a new second
+        second = int(record.created)
+        if second != self.__last_second:
+            self.__last_second = second
+            self.__last_asctime = strftime(
+                self.default_time_format, self.converter(record.created)
+            )
+
+        return self.default_msec_format % (self.__last_asctime, record.msecs)
+
+
+# Both listener threads format through the one FileHandler, whose lock serialises emit()
+# That lock also guards the formatter's cached asctime, so a single formatter can be shared
+_FORMATTER = _LoggingFormatter(LOGGING_FORMAT)
 
 
 class LoggingContext:
-    def __init__(self, module: str, level: int = DEBUG, /):
+    _INSTANCE: ClassVar[LoggingContext | None] = None
+
+    # There is only one root logger per process, so every construction shares one context
+    # The first construction decides the module and level; later arguments are ignored
+    def __new__(cls, module: str, level: int = DEBUG, /) -> Self:
+        if cls._INSTANCE is not None:
+            return cls._INSTANCE
+
+        self = super().__new__(cls)
+
         self.folder = root_dir() / "Logs" / module
-        self.file = self.folder / f"{now().strftime(FILE_DATE_FORMAT)}.txt"
+        self.file = self.folder / f"{format_file_date(now())}.txt"
         self.level = level
 
-        self.formatter = Formatter(LOGGING_FORMAT)
-
-        self.queue: Queue | None = None
+        self.queue: SimpleQueue | None = None
         self.listener: QueueListener | None = None
 
+        self.local_queue: LocalSimpleQueue | None = None
+        self.local_listener: QueueListener | None = None
+
+        self.__depth: int = 0
+
+        cls._INSTANCE = self
+        return self
+
     def __enter__(self) -> Self:
-        self.__start__()
+        # Nested entries reuse the running listener instead of replacing it
+        if self.__depth == 0:
+            self.__start__()
+
+        self.__depth += 1
         return self
 
     def __exit__(self, *_) -> None:
-        self.__stop__()
+        self.__depth -= 1
+
+        if self.__depth == 0:
+            self.__stop__()
 
     def __start__(self) -> None:
         makedirs(self.folder, exist_ok=True)
 
         handler = FileHandler(self.file)
-        handler.setFormatter(self.formatter)
+        handler.setFormatter(_FORMATTER)
 
-        self.queue = Queue()
-        self.listener = QueueListener(self.queue, handler)
+        # Child processes log to the file through the cross-process queue
+        self.queue = SimpleQueue()
+        self.listener = _QueueListener(self.queue, handler)
         self.listener.start()
 
-        _setup_handler(self.level, self.queue)
+        # This process logs through an in-memory queue, so the event loop never waits on the pipe
+        self.local_queue = LocalSimpleQueue()
+        self.local_listener = QueueListener(self.local_queue, handler)
+        self.local_listener.start()
+
+        _setup_handler(self.level, self.local_queue)
 
     def __stop__(self) -> None:
+        self.local_listener.stop()
         self.listener.stop()
         self.queue.close()
-        self.queue.join_thread()
 
 
 def log(message: str, level: int = INFO, /, *, error: BaseException | None = None) -> None:
-    root = getLogger()
-    root.log(level, message, exc_info=error)
+    _logger.log(level, message, exc_info=error)
 
 
 class CustomProcessPoolExecutor(ProcessPoolExecutor):
@@ -196,13 +308,29 @@ class CustomProcessPoolExecutor(ProcessPoolExecutor):
         **kwargs: P.kwargs,
     ) -> Future[T]:
         loop = get_running_loop()
-        wrapped = partial(func, *args, **kwargs)
-        return loop.run_in_executor(self, wrapped)
 
+        # run_in_executor forwards positional arguments itself
+        if not kwargs:
+            return loop.run_in_executor(self, func, *args)
 
-def create_process_pool(*, max_workers: int, **kwargs: Any) -> CustomProcessPoolExecutor:
+        return loop.run_in_executor(self, partial(func, *args, **kwargs))
+
+
+def create_process_pool(
+    *, max_workers: int, preload: tuple[str, ...] = (), **kwargs: Any
+) -> CustomProcessPoolExecutor:
     cpus = cpu_count() or 1
     real_max_workers = max(min(cpus - 1, max_workers), 1)
+
+    # Forked workers inherit the parent's imported modules instead of importing them again
+    # Only Linux is opted in, since fork is unsafe on macOS (where CPython defaults to spawn)
+    if "mp_context" not in kwargs and platform == "linux":
+        kwargs["mp_context"] = get_context("fork")
+
+    # Workers are forked lazily, so import what they need before the first one starts
+    for module in preload:
+        import_module(module)
+
     return CustomProcessPoolExecutor(max_workers=real_max_workers, **kwargs)
 
 
@@ -210,7 +338,7 @@ def _signal_interrupt(code: int, /, *_) -> None:
     raise SystemExit(code)
 
 
-def initialize_process(level: int, queue: Queue, /) -> None:
+def initialize_process(level: int, queue: SimpleQueue, /) -> None:
     _setup_handler(level, queue)
     signal(SIGINT, partial(_signal_interrupt, 130))
     signal(SIGTERM, partial(_signal_interrupt, 143))
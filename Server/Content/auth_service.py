@@ -10,7 +10,7 @@ from Common import (
     SelfUser,
     Session,
     Token,
-    check_password,
+    check_password_async,
     log,
     to_json,
 )
@@ -101,10 +101,8 @@ class AuthService(BaseService):
         user_json = await self.server.db.get_user(username)
 
         hashed_password = DUMMY_HASH if user_json is None else user_json["hashed_password"]
-        correct = await self.server.process_pool.submit_async(
-            check_password,
-            password,
-            hashed_password,
+        correct = await check_password_async(
+            password, hashed_password, pool=self.server.process_pool
         )
 
         if user_json is None or not correct:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from enum import Enum
 from typing import TYPE_CHECKING
 
@@ -66,8 +67,12 @@ def ratelimit(*, limit: int, interval: float, bucket_type: BucketType) -> RespDe
         async def wrapper(service: BaseService, request: Request, /) -> RespType:
             source = bucket_type.get_source(service, request)
 
-            meta = ensure_meta(wrapper)
-            hits = meta[k1][k2].setdefault(source, [])
+            buckets = ensure_meta(wrapper)[k1][k2]
+
+            try:
+                hits = buckets[source]
+            except KeyError:
+                hits = buckets[source] = deque(maxlen=limit)
 
             try:
                 check_ratelimit(hits, limit=limit, interval=interval)
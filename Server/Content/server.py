@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from asyncio import gather, run
+from asyncio import Runner, Semaphore, eager_task_factory, gather
 from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING
+from weakref import WeakValueDictionary
 
 from aiohttp import WSCloseCode
 from aiohttp.web import Application, AppRunner, TCPSite
@@ -16,16 +17,26 @@ from .resource_service import ResourceService
 from .schedule import AutopilotManager
 from .websocket_service import AutopilotWebSocketService, UserWebSocketService
 
+# uvloop is optional (it is unavailable on Windows); fall back to the stdlib event loop
+try:
+    from uvloop import new_event_loop
+except ImportError:
+    new_event_loop = None
+
 if TYPE_CHECKING:
     from typing import Self
 
-    from Common import LoggingContext, SelfUser, ServerConfig, Session, Token
+    from Common import LoggingContext, SelfUser, ServerConfig, Session, Token, WSProxy
 
     from .resource import Resource
 
 __all__ = ("Server",)
 
 
+# Upper bound on the number of WebSocket closing handshakes in flight during shutdown
+MAX_CONCURRENT_CLOSES = 256
+
+
 class Server:
     def __init__(
         self,
@@ -37,6 +48,7 @@ class Server:
 
         self.process_pool = create_process_pool(
             max_workers=config.max_process_pool_workers,
+            preload=("bcrypt",),
             initializer=initialize_process,
             initargs=(log_ctx.level, log_ctx.queue),
         )
@@ -55,7 +67,8 @@ class Server:
             AutopilotWebSocketService(self),
         )
 
-        self.key_to_token: dict[str, Token] = {}
+        # Tokens are owned by user_to_tokens; keys disappear once their token is discarded
+        self.key_to_token: WeakValueDictionary[str, Token] = WeakValueDictionary()
         self.user_to_tokens: dict[SelfUser, set[Token]] = {}
         self.session_id_to_session: dict[str, Session] = {}
         self.resource_id_to_resource: dict[int, Resource] = {}
@@ -76,12 +89,19 @@ class Server:
         log("Service running.")
 
     async def __stop__(self) -> None:
-        coros = (
-            connection.close(code=WSCloseCode.GOING_AWAY)
-            for session in self.session_id_to_session.values()
-            for connection in session.connections.values()
-        )
-        await gather(*coros)
+        semaphore = Semaphore(MAX_CONCURRENT_CLOSES)
+
+        async def close(connection: WSProxy, /) -> None:
+            async with semaphore:
+                await connection.close(code=WSCloseCode.GOING_AWAY)
+
+        # Snapshot the connections first, since closing them removes them from their sessions
+        connections = [
+            connection
+            for session in list(self.session_id_to_session.values())
+            for connection in list(session.connections.values())
+        ]
+        await gather(*(close(connection) for connection in connections))
 
         await self.runner.cleanup()
 
@@ -105,6 +125,9 @@ class Server:
 
     def run(self) -> None:
         try:
-            run(self.start())
+            with Runner(loop_factory=new_event_loop) as runner:
+                # Start new tasks eagerly so that ones which finish without suspending skip the loop
+                runner.get_loop().set_task_factory(eager_task_factory)
+                runner.run(self.start())
         except (KeyboardInterrupt, SystemExit):
             log("Received signal to terminate program.")
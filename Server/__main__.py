@@ -1,4 +1,4 @@
-from Common import LoggingContext, config
+from Common import LoggingContext, get_config
 from Server import Server
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ if __name__ == "__main__":
     with LoggingContext("Server") as log_ctx:
 
         server = Server(
-            config=config.server,
+            config=get_config().server,
             log_ctx=log_ctx,
         )
         server.run()